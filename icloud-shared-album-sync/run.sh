@@ -13,6 +13,8 @@ TIMEOUT="$(bashio::config 'timeout' || echo 40)"
 INTERVAL_MINUTES="$(bashio::config 'interval_minutes' || echo 180)"
 DEBUG="$(bashio::config 'debug' || echo false)"
 MIRROR_MISSING="$(bashio::config 'mirror_missing' || echo false)"
+DOWNLOAD_WORKERS="$(bashio::config 'download_workers' || echo 6)"
+PER_HOST_CONCURRENCY="$(bashio::config 'per_host_concurrency' || echo 4)"
 ALBUMS="$(bashio::config 'albums' || echo '')"
 
 # If debug is true, enable shell xtrace; otherwise stay quiet.
@@ -41,6 +43,8 @@ run_once() {
     --timeout "${TIMEOUT}"
     --debug "${DEBUG}"
     --mirror-missing "${MIRROR_MISSING}"
+    --download-workers "${DOWNLOAD_WORKERS}"
+    --per-host-concurrency "${PER_HOST_CONCURRENCY}"
     --albums "${ALBUMS}"
   )
 
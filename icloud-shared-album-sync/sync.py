@@ -4,11 +4,41 @@ import argparse
 import os
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+from email.message import Message
 import logging
 import re
-from typing import List, Tuple, Dict, Any, Optional
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Any, Optional, Iterator, Iterable
+from urllib.parse import urlparse
+
+try:
+    import orjson
+
+    def _loads(b: bytes) -> Any:
+        return orjson.loads(b)
+
+    def _dumps(o: Any) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_INDENT_2)
+except ImportError:  # stdlib fallback
+    def _loads(b: bytes) -> Any:
+        return json.loads(b)
+
+    def _dumps(o: Any) -> bytes:
+        return json.dumps(o, ensure_ascii=False, indent=2).encode('utf-8')
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C backend
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 # =========================
 # HARD GUARANTEES: NO THUMBNAILS
@@ -17,6 +47,7 @@ from typing import List, Tuple, Dict, Any, Optional
 MIN_LONG_EDGE = 2000          # require at least this many pixels on the long side
 MIN_FILESIZE_BYTES = 300 * 1024  # require at least this many bytes (if size known)
 
+
 # =========================
 # Logging
 # =========================
@@ -30,22 +61,27 @@ def setup_logging(debug: bool) -> None:
 # =========================
 # Single-line YAML normalizer
 # =========================
-KEY_PATTERN = re.compile(r'(?<![\w-])([A-Za-z_][\w-]*)\s*:', re.U)
+KEY_PATTERN = re.compile(r'(?<![\w-])[A-Za-z_][\w-]*\s*:')
+_DASH_MULTILINE_RE = re.compile(r'^\s*-\s+', re.M)
 
 def _find_key_spans(s: str) -> List[Tuple[str, int, int]]:
     spans: List[Tuple[str, int, int]] = []
     for match in KEY_PATTERN.finditer(s):
-        key = match.group(1)
-        spans.append((key, match.start(1), match.end()))
+        start, end = match.span()
+        # Match covers "key<ws>:"; slice the key off the front instead of capturing it
+        spans.append((s[start:end - 1].rstrip(), start, end))
     return spans
 
 def normalize_single_line_yaml(albums_str: str) -> str:
     s = albums_str.strip()
-    if '\n' in s and re.search(r'^\s*-\s+', s, re.M):
+    if '\n' in s and _DASH_MULTILINE_RE.search(s):
         return s
     if not s.startswith('- '):
         s = '- ' + s
     body = s[2:]
+    if ':' not in body:
+        # No keys at all; skip the regex pass
+        return s
     spans = _find_key_spans(body)
     if not spans:
         return s
@@ -65,15 +101,20 @@ def normalize_single_line_yaml(albums_str: str) -> str:
 # =========================
 THUMB_HINTS = ("thumb", "thumbnail", "square", "poster", "preview", "small", "mini", "tile", "low", "tiny")
 VIDEO_EXTS = (".mp4", ".mov", ".m4v", ".hevc")
-DIM_IN_KEY = re.compile(r'(\d+)[xX](\d+)')  # e.g., R4032x3024 or 3840x2160
+DIM_IN_KEY = re.compile(r'(\d+)[xX](\d+)', re.ASCII)  # e.g., R4032x3024 or 3840x2160
 
 PREFERRED_ORIGINAL_KEYS = (
     "resoriginal", "original", "resjpegfull", "fullres", "master", "resfull", "publicsharegenericlarge"
 )
+_PREF_PRIORITY = {k.lower(): i for i, k in enumerate(PREFERRED_ORIGINAL_KEYS)}
+
+# Substring matching: a hint containing another hint ("thumbnail" vs "thumb") can never change
+# the result, so only the minimal hints go into the alternation
+_THUMB_MATCH_HINTS = tuple(h for h in THUMB_HINTS if not any(o != h and o in h for o in THUMB_HINTS))
+_THUMB_RE = re.compile('|'.join(map(re.escape, _THUMB_MATCH_HINTS)))
 
 def _is_thumbish_name(name: str) -> bool:
-    low = (name or "").lower()
-    return any(h in low for h in THUMB_HINTS)
+    return bool(name) and _THUMB_RE.search(name.lower()) is not None
 
 def _full_url(location: Optional[str], path: str) -> str:
     if path.startswith("http://") or path.startswith("https://"):
@@ -105,7 +146,9 @@ def _candidate_from_derivative(k: str, v: Dict[str, Any], location: Optional[str
     # Reject anything hinting at thumbs via key/type/filename/url
     fname = (v.get("fileName") or v.get("filename") or "")
     dtype = (v.get("derivativeType") or v.get("type") or "")
-    if _is_thumbish_name(k) or _is_thumbish_name(fname) or _is_thumbish_name(dtype) or _is_thumbish_name(url_full):
+    # One scan over all four fields; the newline separator keeps hints from matching across fields
+    url_lc = url_full.lower()
+    if _THUMB_RE.search("\n".join((k or "", fname, dtype)).lower() + "\n" + url_lc):
         return None
 
     w = _get_int(v.get("width") or v.get("W"))
@@ -117,13 +160,13 @@ def _candidate_from_derivative(k: str, v: Dict[str, Any], location: Optional[str
             w, h = k_w, k_h
 
     size = _get_int(v.get("fileSize") or v.get("size"))
-    return {"url": url_full, "w": w, "h": h, "key": k, "size": size}
+    return {"url": url_full, "url_lc": url_lc, "w": w, "h": h, "key": k, "size": size}
 
 def _meets_fullsize_floor(c: Dict[str, Any]) -> bool:
     long_edge = max(c.get("w", 0), c.get("h", 0))
     size = c.get("size", 0)
     # Allow videos even if dimension unknown, but still apply file size floor if available
-    is_video = any(c["url"].lower().endswith(ext) for ext in VIDEO_EXTS)
+    is_video = c["url_lc"].endswith(VIDEO_EXTS)
     if is_video:
         return size == 0 or size >= MIN_FILESIZE_BYTES
     # For photos, require both long-edge and (if known) file size
@@ -133,28 +176,42 @@ def _meets_fullsize_floor(c: Dict[str, Any]) -> bool:
         return False
     return True
 
+def _iter_candidates(derivatives: Any, location: Optional[str]) -> Iterator[Dict[str, Any]]:
+    if not isinstance(derivatives, dict):
+        return
+    for k, v in derivatives.items():
+        if isinstance(v, dict):
+            cand = _candidate_from_derivative(k, v, location)
+            if cand:
+                yield cand
+
 def pick_best_download_url_from_asset(asset: Dict[str, Any]) -> Optional[str]:
     location = asset.get("url_location")
     derivatives = asset.get("derivatives") or {}
 
-    candidates: List[Dict[str, Any]] = []
-    if isinstance(derivatives, dict):
-        for k, v in derivatives.items():
-            if isinstance(v, dict):
-                cand = _candidate_from_derivative(k, v, location)
-                if cand:
-                    candidates.append(cand)
+    # Single pass over the candidates that meet the floor: keep the highest-priority
+    # preferred original and the largest candidate overall
+    no_pref = len(PREFERRED_ORIGINAL_KEYS)
+    best_pref: Optional[Dict[str, Any]] = None
+    best_pref_pri = no_pref
+    best: Optional[Dict[str, Any]] = None
+    best_score = (-1, -1)
+    for c in _iter_candidates(derivatives, location):
+        if not _meets_fullsize_floor(c):
+            continue
+        pri = _PREF_PRIORITY.get((c["key"] or "").lower(), no_pref)
+        if pri < best_pref_pri:
+            best_pref, best_pref_pri = c, pri
+        score = (c["w"] * c["h"], c["size"])
+        if score > best_score:
+            best, best_score = c, score
 
     # 1) Prefer explicit originals if they meet the floor
-    for pref in PREFERRED_ORIGINAL_KEYS:
-        for c in candidates:
-            if c["key"] and c["key"].lower() == pref and _meets_fullsize_floor(c):
-                return c["url"]
+    if best_pref:
+        return best_pref["url"]
 
     # 2) Otherwise choose the largest derivative that meets the fullsize floor
-    fullsize_ok = [c for c in candidates if _meets_fullsize_floor(c)]
-    if fullsize_ok:
-        best = max(fullsize_ok, key=lambda x: (x["w"] * x["h"], x["size"]))
+    if best:
         return best["url"]
 
     # 3) As a final attempt, try the asset's original path *only if* it doesn't look thumb-ish.
@@ -168,6 +225,29 @@ def pick_best_download_url_from_asset(asset: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+# =========================
+# Shared HTTP session
+# =========================
+# One pooled, keep-alive session for every request so download workers reuse
+# TCP/TLS connections to the iCloud hosts instead of handshaking per file.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504]),
+))
+
+# Throttling responses are retried by _get_with_backoff (outside urllib3) so that
+# Retry-After is honored and the delay grows exponentially.
+THROTTLE_STATUSES = (429, 503)
+THROTTLE_RETRIES = 3
+THROTTLE_MAX_DELAY = 30  # seconds
+
+# Per-host transfer slots, created lazily on first use
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
 # =========================
 # Fetch media list from iCloud Shared Album
 # =========================
@@ -180,25 +260,25 @@ def fetch_album_media(shared_url: str, timeout: int) -> List[str]:
         base_api_url = f"https://p23-sharedstreams.icloud.com/{album_id}/sharedstreams"
 
         payload = {"streamCtag": None}
-        r = requests.post(f"{base_api_url}/webstream", json=payload, timeout=timeout)
+        r = _SESSION.post(f"{base_api_url}/webstream", json=payload, timeout=timeout)
         r.raise_for_status()
-        stream_data = r.json()
+        stream_data = _loads(r.content)
 
         host = stream_data.get("X-Apple-MMe-Host")
         if host:
             base_api_url = f"https://{host}/{album_id}/sharedstreams"
-            r = requests.post(f"{base_api_url}/webstream", json=payload, timeout=timeout)
+            r = _SESSION.post(f"{base_api_url}/webstream", json=payload, timeout=timeout)
             r.raise_for_status()
-            stream_data = r.json()
+            stream_data = _loads(r.content)
 
         photo_guids = [p.get("photoGuid") for p in stream_data.get("photos", []) if p.get("photoGuid")]
         if not photo_guids:
             logging.info("No photos listed in stream.")
             return []
 
-        r = requests.post(f"{base_api_url}/webasseturls", json={"photoGuids": photo_guids}, timeout=timeout)
+        r = _SESSION.post(f"{base_api_url}/webasseturls", json={"photoGuids": photo_guids}, timeout=timeout)
         r.raise_for_status()
-        items = r.json().get("items", {}) or {}
+        items = _loads(r.content).get("items", {}) or {}
 
         media_urls: List[str] = []
         for guid, asset in items.items():
@@ -213,7 +293,7 @@ def fetch_album_media(shared_url: str, timeout: int) -> List[str]:
             logging.warning("No valid media URLs found (all failed full-size checks).")
         return media_urls
 
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         logging.error("Error fetching album media: %s", e)
         return []
 
@@ -221,122 +301,247 @@ def fetch_album_media(shared_url: str, timeout: int) -> List[str]:
 # =========================
 # Download, prune, mirror
 # =========================
+_FILENAME_RE = re.compile(r'filename\*?=([^;]+)')
+_COPY_BUFSIZE = 1024 * 1024
+
+# Per-album sidecar of ETag/Last-Modified per URL path, used for conditional re-downloads
+VALIDATORS_FILENAME = ".etags.json"
+
 def _content_length(resp: requests.Response) -> int:
     try:
         return int(resp.headers.get("Content-Length", "0"))
     except Exception:
         return 0
 
-def download_file(url: str, dest_dir: str, index_filename: Optional[str], timeout: int = 40) -> bool:
+def _filename_from_response(resp: requests.Response, url: str) -> str:
+    cd = resp.headers.get("Content-Disposition")
+    m = _FILENAME_RE.search(cd) if cd else None
+    if not m:
+        return os.path.basename(url.split('?')[0])
+    raw = m.group(1).strip().strip('"')
+    if "''" in raw:
+        # RFC 5987 ext-value (filename*=UTF-8''...); let the email parser decode it
+        msg = Message()
+        msg["Content-Disposition"] = cd
+        raw = msg.get_filename() or raw
+    return os.path.basename(raw)
+
+def _retry_after_seconds(resp: requests.Response) -> int:
     try:
-        os.makedirs(dest_dir, exist_ok=True)
-
-        # HEAD first to enforce filesize floor when we don't know dims (e.g., url_path fallback)
-        try:
-            head = requests.head(url, timeout=timeout, allow_redirects=True)
-            if head.ok:
-                cl = _content_length(head)
-                if cl and cl < MIN_FILESIZE_BYTES:
-                    logging.warning("Rejecting likely thumbnail (too small: %d bytes): %s", cl, url)
-                    return False
-        except requests.RequestException:
-            # If HEAD fails, we'll still GET but will double-check size while streaming
-            pass
-
-        resp = requests.get(url, stream=True, timeout=timeout)
-        resp.raise_for_status()
-
-        cd = resp.headers.get("Content-Disposition", "")
-        m = re.search(r'filename\*?=([^;]+)', cd)
-        if m:
-            raw = m.group(1).strip().strip('"')
-            filename = os.path.basename(raw)
-        else:
-            filename = os.path.basename(url.split('?')[0])
+        return max(0, int(resp.headers.get("Retry-After", "")))
+    except Exception:
+        return 0
 
-        path = os.path.join(dest_dir, filename)
+def _host_slot(url: str, limit: int) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(max(1, limit))
+        return slot
+
+def _get_with_backoff(url: str, timeout: int, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    # Back off on throttling (429/503), honoring Retry-After when the server sends one.
+    # The delay is clamped: we sleep while holding the host slot, stalling every worker queued on it.
+    for attempt in range(THROTTLE_RETRIES + 1):
+        resp = _SESSION.get(url, stream=True, timeout=timeout, headers=headers)
+        if resp.status_code not in THROTTLE_STATUSES or attempt == THROTTLE_RETRIES:
+            return resp
+        delay = min(_retry_after_seconds(resp) or 2 ** attempt, THROTTLE_MAX_DELAY)
+        resp.close()
+        logging.warning("Throttled (HTTP %d) by %s; retrying in %ds", resp.status_code, urlparse(url).netloc, delay)
+        time.sleep(delay)
+    return resp
+
+def _validator_key(url: str) -> str:
+    # URL path without the signed query string: stable across runs and unique per asset,
+    # unlike the basename, which two devices can share (IMG_0001.JPG)
+    return urlparse(url).path
+
+def _conditional_headers(dest_dir: str, cached: Optional[Dict[str, str]]) -> Dict[str, str]:
+    # Only revalidate when the previously downloaded file is still on disk and complete
+    if not isinstance(cached, dict) or not isinstance(cached.get("filename"), str) or not cached["filename"]:
+        return {}
+    try:
+        if os.path.getsize(os.path.join(dest_dir, cached["filename"])) < MIN_FILESIZE_BYTES:
+            return {}
+    except OSError:
+        return {}
+    headers: Dict[str, str] = {}
+    etag, last_modified = cached.get("etag"), cached.get("last_modified")
+    if etag and isinstance(etag, str):
+        headers["If-None-Match"] = etag
+    if last_modified and isinstance(last_modified, str):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+def download_file(url: str, dest_dir: str, timeout: int = 40, per_host_concurrency: int = 4,
+                  validators: Optional[Dict[str, Dict[str, str]]] = None) -> Tuple[bool, Optional[str], int]:
+    # Returns (ok, filename, total_bytes); total_bytes is 0 when the server confirmed
+    # (HTTP 304) that the local copy is up to date.
+    tmp_path: Optional[str] = None
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
 
-        # Stream to temp file first, enforce filesize floor
-        tmp_path = path + ".part"
-        total_bytes = 0
-        with open(tmp_path, 'wb') as f:
-            for chunk in resp.iter_content(8192):
-                if chunk:
-                    f.write(chunk)
-                    total_bytes += len(chunk)
+        vkey = _validator_key(url)
+        cached = validators.get(vkey) if validators is not None else None
+        cond_headers = _conditional_headers(dest_dir, cached)
+
+        # Cap concurrent transfers per host so the worker pool doesn't trip iCloud rate limits
+        with _host_slot(url, per_host_concurrency):
+            resp = _get_with_backoff(url, timeout, headers=cond_headers or None)
+            if resp.status_code == 304 and cond_headers and cached:
+                resp.close()
+                # Refresh mtime so keep_days counts from the last time the file was seen in the album,
+                # as it did when every run re-wrote every file
+                try:
+                    os.utime(os.path.join(dest_dir, cached["filename"]))
+                except OSError as e:
+                    logging.warning("Failed to touch %s: %s", cached["filename"], e)
+                logging.debug("Unchanged, skipping: %s", cached["filename"])
+                return True, cached["filename"], 0
+            resp.raise_for_status()
+
+            # Enforce the filesize floor from the GET headers (covers the url_path fallback,
+            # where dimensions are unknown) and bail before reading any body bytes
+            cl = _content_length(resp)
+            if 0 < cl < MIN_FILESIZE_BYTES:
+                resp.close()
+                logging.warning("Rejecting likely thumbnail (too small: %d bytes): %s", cl, url)
+                return False, None, 0
+
+            filename = _filename_from_response(resp, url)
+            path = os.path.join(dest_dir, filename)
+
+            # Stream to temp file first, enforce filesize floor. The temp name is unique per download:
+            # album URLs often share a basename (IMG_0001.JPG from two phones) and workers run in parallel.
+            tmp_path = f"{path}.{uuid.uuid4().hex}.part"
+            # Copy in C with large buffers rather than looping over small chunks in Python
+            resp.raw.decode_content = True
+            with open(tmp_path, 'xb', buffering=_COPY_BUFSIZE) as f:
+                shutil.copyfileobj(resp.raw, f, length=_COPY_BUFSIZE)
+                total_bytes = f.tell()
 
         if total_bytes < MIN_FILESIZE_BYTES:
-            # Too small (likely a thumbnail); do not keep it.
-            try:
-                os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
+            # Too small (likely a thumbnail, sent without Content-Length); do not keep it.
             logging.warning("Rejecting likely thumbnail after download (size=%d): %s", total_bytes, url)
-            return False
+            return False, None, 0
 
         os.replace(tmp_path, path)
         logging.info("Downloaded: %s (%d bytes)", filename, total_bytes)
 
-        # Update index.json
-        if index_filename:
-            index_path = os.path.join(dest_dir, index_filename)
-            try:
-                idx = []
-                if os.path.exists(index_path):
-                    with open(index_path, 'r', encoding='utf-8') as fh:
-                        idx = json.load(fh)
-                idx.insert(0, {
-                    "filename": filename,
-                    "downloaded_at": datetime.utcnow().isoformat() + "Z",
-                    "url": url
-                })
-                with open(index_path, 'w', encoding='utf-8') as fh:
-                    json.dump(idx, fh, ensure_ascii=False, indent=2)
-                logging.debug("Updated %s with %s", index_filename, filename)
-            except Exception as e:
-                logging.warning("Failed to update %s: %s", index_filename, e)
-
-        return True
-
-    except requests.RequestException as e:
+        if validators is not None:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                validators[vkey] = {"filename": filename, "etag": etag or "", "last_modified": last_modified or ""}
+            else:
+                validators.pop(vkey, None)
+        return True, filename, total_bytes
+
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        # resp.raw surfaces urllib3 errors directly (iter_content used to wrap them)
         logging.error("Failed to download %s: %s", url, e)
-        return False
+        return False, None, 0
+    except OSError as e:
+        # Disk full, permission denied, unusable filename...; fail this file, not the whole album
+        logging.error("Failed to save %s: %s", url, e)
+        return False, None, 0
+    finally:
+        # Anything still at the temp path was not promoted (rejected or failed); drop it
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning("Failed to remove %s: %s", tmp_path, e)
+
+def update_index(dest_dir: str, index_filename: str, new_entries: List[Dict[str, Any]]) -> None:
+    # One read + one write per album. Entries arrive in download order; the index is newest-first.
+    index_path = os.path.join(dest_dir, index_filename)
+    try:
+        idx = []
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as fh:
+                idx = _loads(fh.read())
+        idx[:0] = reversed(new_entries)
+        with open(index_path, 'wb') as fh:
+            fh.write(_dumps(idx))
+        logging.debug("Added %d entries to %s", len(new_entries), index_filename)
+    except Exception as e:
+        logging.warning("Failed to update %s: %s", index_filename, e)
+
+def load_validators(dest_dir: str) -> Dict[str, Dict[str, str]]:
+    path = os.path.join(dest_dir, VALIDATORS_FILENAME)
+    try:
+        with open(path, 'rb') as fh:
+            data = _loads(fh.read())
+        if not isinstance(data, dict):
+            return {}
+        # Drop malformed entries (hand-edited or truncated file) rather than failing mid-sync
+        return {k: v for k, v in data.items() if isinstance(v, dict)}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning("Ignoring unreadable %s: %s", VALIDATORS_FILENAME, e)
+        return {}
 
-def prune_files(dest_dir: str, keep_days: int, max_files: int) -> None:
+def save_validators(dest_dir: str, validators: Dict[str, Dict[str, str]]) -> None:
+    path = os.path.join(dest_dir, VALIDATORS_FILENAME)
+    try:
+        with open(path, 'wb') as fh:
+            fh.write(_dumps(validators))
+    except Exception as e:
+        logging.warning("Failed to update %s: %s", VALIDATORS_FILENAME, e)
+
+def _list_files(dest_dir: str) -> List[Tuple[str, str, float]]:
+    # scandir reuses the directory listing for type checks and stat(), one syscall less per entry;
+    # entry.path saves re-joining dest_dir for every removal
+    with os.scandir(dest_dir) as it:
+        return [(e.name, e.path, e.stat().st_mtime) for e in it if e.is_file()]
+
+def prune_files(dest_dir: str, keep_days: int, max_files: int, exclude: Iterable[str] = ()) -> None:
     try:
-        files = [(f, os.path.getmtime(os.path.join(dest_dir, f))) for f in os.listdir(dest_dir)]
+        files = _list_files(dest_dir)
     except FileNotFoundError:
         return
 
-    files.sort(key=lambda x: x[1], reverse=True)
+    # Bookkeeping files (index, validators) are neither aged out nor counted against max_files
+    skip = set(exclude)
+    if skip:
+        files = [entry for entry in files if entry[0] not in skip]
+
+    files.sort(key=lambda x: x[2], reverse=True)
 
     if keep_days > 0:
-        cutoff = datetime.now() - timedelta(days=keep_days)
-        for f, mtime in files:
-            if datetime.fromtimestamp(mtime) < cutoff:
-                os.remove(os.path.join(dest_dir, f))
+        cutoff_ts = time.time() - keep_days * 86400
+        kept: List[Tuple[str, str, float]] = []
+        for f, full_path, mtime in files:
+            if mtime < cutoff_ts:
+                os.remove(full_path)
                 logging.info("Pruned by age: %s", f)
-
-    try:
-        files = [(f, os.path.getmtime(os.path.join(dest_dir, f))) for f in os.listdir(dest_dir)]
-    except FileNotFoundError:
-        return
-    files.sort(key=lambda x: x[1], reverse=True)
+            else:
+                kept.append((f, full_path, mtime))
+        files = kept
 
     if max_files > 0 and len(files) > max_files:
-        for f, _ in files[max_files:]:
-            os.remove(os.path.join(dest_dir, f))
+        for f, full_path, _ in files[max_files:]:
+            os.remove(full_path)
             logging.info("Pruned by count: %s", f)
 
 def mirror_missing_files(dest_dir: str, current_filenames: List[str]) -> None:
     try:
-        existing = set(os.listdir(dest_dir))
+        with os.scandir(dest_dir) as it:
+            existing = {e.name: e.path for e in it if e.is_file()}
     except FileNotFoundError:
         return
-    to_delete = existing - set(current_filenames)
-    for f in to_delete:
+    keep = set(current_filenames)
+    for f, full_path in existing.items():
+        if f in keep:
+            continue
         try:
-            os.remove(os.path.join(dest_dir, f))
+            os.remove(full_path)
             logging.info("Mirrored deletion: %s", f)
         except Exception as e:
             logging.warning("Failed to delete %s: %s", f, e)
@@ -380,6 +585,8 @@ def sync_album(album_cfg: Dict[str, Any], global_cfg: Dict[str, Any]) -> None:
     keep_days = global_cfg.get('keep_days', 0)
     max_files = global_cfg.get('max_files', 500)
     mirror_missing = global_cfg.get('mirror_missing', False)
+    download_workers = max(1, global_cfg.get('download_workers', 6))
+    per_host_concurrency = global_cfg.get('per_host_concurrency', 4)
 
     dest_dir = resolve_dest_dir(dest_mode, media_subfolder, album_subfolder)
     os.makedirs(dest_dir, exist_ok=True)
@@ -390,20 +597,49 @@ def sync_album(album_cfg: Dict[str, Any], global_cfg: Dict[str, Any]) -> None:
         logging.warning("No media found to download.")
         return
 
+    # Workers only touch their own URL's entry, so sharing the dict across threads is safe
+    validators = load_validators(dest_dir)
+
+    # Downloads are I/O-bound; run them concurrently and collect results in input order
+    with ThreadPoolExecutor(max_workers=download_workers) as ex:
+        results = list(ex.map(
+            lambda u: (u, download_file(u, dest_dir, timeout=timeout,
+                                        per_host_concurrency=per_host_concurrency,
+                                        validators=validators)),
+            media_urls,
+        ))
+
+    # All files from one run share a single timestamp
+    downloaded_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     downloaded_filenames: List[str] = []
-    for url in media_urls:
-        if download_file(url, dest_dir, index_filename=index_filename, timeout=timeout):
-            filename = os.path.basename(url.split('?')[0])
+    new_entries: List[Dict[str, Any]] = []
+    for url, (ok, filename, total_bytes) in results:
+        if ok and filename:
             downloaded_filenames.append(filename)
+            if not total_bytes:
+                # Up to date on disk; already in the index from an earlier run
+                continue
+            new_entries.append({
+                "filename": filename,
+                "downloaded_at": downloaded_at,
+                "url": url
+            })
 
-    prune_files(dest_dir, keep_days, max_files)
+    if index_filename and new_entries:
+        update_index(dest_dir, index_filename, new_entries)
+    if downloaded_filenames:
+        # Only keep validators for URLs still in the album so the sidecar doesn't grow forever
+        current = {_validator_key(u) for u in media_urls}
+        save_validators(dest_dir, {k: v for k, v in validators.items() if k in current})
 
-    if mirror_missing:
-        try:
-            current_on_disk = [f for f in os.listdir(dest_dir) if os.path.isfile(os.path.join(dest_dir, f))]
-        except FileNotFoundError:
-            current_on_disk = []
-        mirror_missing_files(dest_dir, current_on_disk if not downloaded_filenames else downloaded_filenames)
+    # Our own bookkeeping files; they are not part of the album
+    bookkeeping = [VALIDATORS_FILENAME] + ([index_filename] if index_filename else [])
+
+    prune_files(dest_dir, keep_days, max_files, exclude=bookkeeping)
+
+    # With nothing downloaded there is no album listing to mirror against; leave the folder alone.
+    if mirror_missing and downloaded_filenames:
+        mirror_missing_files(dest_dir, downloaded_filenames + bookkeeping)
 
 
 # =========================
@@ -416,6 +652,8 @@ def main() -> None:
     parser.add_argument('--timeout', type=int, default=40)
     parser.add_argument('--debug', type=lambda s: str(s).lower() in ('1','true','yes','on'), default=False)
     parser.add_argument('--mirror-missing', type=bool, default=True)
+    parser.add_argument('--download-workers', type=int, default=6)
+    parser.add_argument('--per-host-concurrency', type=int, default=4)
     parser.add_argument('--albums', type=str, required=True)
     args = parser.parse_args()
 
@@ -425,7 +663,9 @@ def main() -> None:
         'keep_days': args.keep_days,
         'max_files': args.max_files,
         'timeout': args.timeout,
-        'mirror_missing': args.mirror_missing
+        'mirror_missing': args.mirror_missing,
+        'download_workers': args.download_workers,
+        'per_host_concurrency': args.per_host_concurrency
     }
 
     albums_str = args.albums.strip()
@@ -434,7 +674,7 @@ def main() -> None:
         albums_str = normalize_single_line_yaml(albums_str)
 
     try:
-        albums = yaml.safe_load(albums_str)
+        albums = yaml.load(albums_str, Loader=_YamlLoader)
         if not isinstance(albums, list):
             albums = [albums] if albums else []
     except yaml.YAMLError as e: